@@ -5,14 +5,20 @@ Press ENTER to start recording, ENTER again to stop.
 Uses OpenAI Whisper API for transcription.
 """
 
+import functools
+import io
 import os
 import sys
-import tempfile
 import wave
 import struct
 
-def record_audio(filename, sample_rate=16000):
-    """Record audio using PyAudio"""
+import numpy as np
+
+# Local Whisper model for clipboard dictation (English-only, smallest)
+LOCAL_MODEL = "tiny.en"
+
+def record_audio(sample_rate=16000):
+    """Record audio using PyAudio, returning (int16 samples, sample rate)"""
     try:
         import pyaudio
     except ImportError:
@@ -24,28 +30,26 @@ def record_audio(filename, sample_rate=16000):
     FORMAT = pyaudio.paInt16
     CHANNELS = 1
 
+    # Captured on PortAudio's thread; the main thread only waits for ENTER
+    audio = bytearray()
+
+    def on_audio(in_data, frame_count, time_info, status):
+        audio.extend(in_data)
+        return (None, pyaudio.paContinue)
+
     p = pyaudio.PyAudio()
 
     stream = p.open(format=FORMAT,
                     channels=CHANNELS,
                     rate=sample_rate,
                     input=True,
-                    frames_per_buffer=CHUNK)
+                    frames_per_buffer=CHUNK,
+                    stream_callback=on_audio)
 
     print("\n🎤 Recording... (press ENTER to stop)")
 
-    frames = []
-
     # Record until Enter is pressed
-    import select
-    while True:
-        data = stream.read(CHUNK, exception_on_overflow=False)
-        frames.append(data)
-
-        # Check for Enter key (non-blocking)
-        if sys.stdin in select.select([sys.stdin], [], [], 0)[0]:
-            sys.stdin.readline()
-            break
+    sys.stdin.readline()
 
     print("⏹️  Recording stopped.")
 
@@ -53,17 +57,9 @@ def record_audio(filename, sample_rate=16000):
     stream.close()
     p.terminate()
 
-    # Save as WAV
-    wf = wave.open(filename, 'wb')
-    wf.setnchannels(CHANNELS)
-    wf.setsampwidth(p.get_sample_size(FORMAT))
-    wf.setframerate(sample_rate)
-    wf.writeframes(b''.join(frames))
-    wf.close()
+    return np.frombuffer(audio, dtype=np.int16), sample_rate
 
-    return filename
-
-def transcribe_openai(audio_path):
+def transcribe_openai(samples, sample_rate):
     """Transcribe using OpenAI Whisper API"""
     try:
         from openai import OpenAI
@@ -79,24 +75,60 @@ def transcribe_openai(audio_path):
 
     client = OpenAI(api_key=api_key)
 
-    with open(audio_path, 'rb') as audio_file:
-        transcript = client.audio.transcriptions.create(
-            model="whisper-1",
-            file=audio_file
-        )
+    # Encode an in-memory WAV for upload
+    wav_data = io.BytesIO()
+    with wave.open(wav_data, 'wb') as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(sample_rate)
+        wf.writeframes(samples.tobytes())
+
+    transcript = client.audio.transcriptions.create(
+        model="whisper-1",
+        file=("audio.wav", wav_data.getvalue(), "audio/wav")
+    )
 
     return transcript.text
 
-def transcribe_local(audio_path):
-    """Transcribe using local Whisper"""
+@functools.lru_cache(maxsize=1)
+def load_local_model():
+    """Load the local Whisper model once and reuse it for every recording"""
+    try:
+        from faster_whisper import WhisperModel
+        return "faster-whisper", WhisperModel(LOCAL_MODEL, device="auto", compute_type="int8")
+    except ImportError:
+        pass
+
     try:
         import whisper
+        return "openai-whisper", whisper.load_model(LOCAL_MODEL)
     except ImportError:
+        return None, None
+
+def transcribe_local(samples, sample_rate):
+    """Transcribe using local Whisper (faster-whisper if available)"""
+    # Both backends take 16kHz float32 audio directly
+    audio = samples.astype(np.float32) / 32768.0
+
+    backend, model = load_local_model()
+
+    if backend == "faster-whisper":
+        # One-shot dictation: greedy decoding on VAD-trimmed speech
+        segments, _ = model.transcribe(
+            audio,
+            beam_size=1,
+            vad_filter=True,
+            vad_parameters=dict(min_silence_duration_ms=500),
+            condition_on_previous_text=False,
+            language="en"
+        )
+        return "".join(segment.text for segment in segments).strip()
+
+    if backend is None:
         print("Local whisper not available, using OpenAI API")
-        return transcribe_openai(audio_path)
+        return transcribe_openai(samples, sample_rate)
 
-    model = whisper.load_model("base")
-    result = model.transcribe(audio_path)
+    result = model.transcribe(audio)
     return result["text"]
 
 def main():
@@ -120,35 +152,27 @@ def main():
             break
 
         # Record
-        with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as f:
-            temp_path = f.name
-
-        try:
-            record_audio(temp_path)
-
-            print("⏳ Transcribing...")
-
-            if use_openai:
-                text = transcribe_openai(temp_path)
-            else:
-                text = transcribe_local(temp_path)
-
-            if text:
-                print(f"\n📝 Transcript: \"{text}\"")
-
-                # Copy to clipboard on macOS
-                try:
-                    import subprocess
-                    subprocess.run(['pbcopy'], input=text.encode(), check=True)
-                    print("✅ Copied to clipboard! Paste with Cmd+V")
-                except:
-                    pass
-            else:
-                print("❌ No speech detected")
-
-        finally:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+        samples, sample_rate = record_audio()
+
+        print("⏳ Transcribing...")
+
+        if use_openai:
+            text = transcribe_openai(samples, sample_rate)
+        else:
+            text = transcribe_local(samples, sample_rate)
+
+        if text:
+            print(f"\n📝 Transcript: \"{text}\"")
+
+            # Copy to clipboard on macOS
+            try:
+                import subprocess
+                subprocess.run(['pbcopy'], input=text.encode(), check=True)
+                print("✅ Copied to clipboard! Paste with Cmd+V")
+            except:
+                pass
+        else:
+            print("❌ No speech detected")
 
 if __name__ == "__main__":
     main()
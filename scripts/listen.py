@@ -11,8 +11,7 @@ import os
 import sys
 import subprocess
 import tempfile
-import json
-import urllib.request
+import time
 
 def record_with_sounddevice(filename, duration, sample_rate=16000):
     """Record using sounddevice (pip install sounddevice soundfile)"""
@@ -24,10 +23,14 @@ def record_with_sounddevice(filename, duration, sample_rate=16000):
 
     print(f"🎤 Recording for {duration} seconds... Speak now!")
 
-    audio = sd.rec(int(duration * sample_rate), samplerate=sample_rate, channels=1, dtype='int16')
-    sd.wait()
+    # Each captured block is encoded straight into the WAV file
+    with sf.SoundFile(filename, 'w', samplerate=sample_rate, channels=1, subtype='PCM_16') as f:
+        def on_audio(indata, frames, time_info, status):
+            f.write(indata)
+
+        with sd.InputStream(samplerate=sample_rate, channels=1, dtype='int16', callback=on_audio):
+            sd.sleep(int(duration * 1000))
 
-    sf.write(filename, audio, sample_rate)
     return True
 
 def record_with_pyaudio(filename, duration, sample_rate=16000):
@@ -43,48 +46,57 @@ def record_with_pyaudio(filename, duration, sample_rate=16000):
     CHANNELS = 1
 
     p = pyaudio.PyAudio()
+
+    # Chunks are written to the WAV as they arrive; the header is patched on close
+    wf = wave.open(filename, 'wb')
+    wf.setnchannels(CHANNELS)
+    wf.setsampwidth(p.get_sample_size(FORMAT))
+    wf.setframerate(sample_rate)
+
+    def on_audio(in_data, frame_count, time_info, status):
+        wf.writeframesraw(in_data)
+        return (None, pyaudio.paContinue)
+
     stream = p.open(format=FORMAT, channels=CHANNELS, rate=sample_rate,
-                    input=True, frames_per_buffer=CHUNK)
+                    input=True, frames_per_buffer=CHUNK, stream_callback=on_audio)
 
     print(f"🎤 Recording for {duration} seconds... Speak now!")
 
-    frames = []
-    for _ in range(0, int(sample_rate / CHUNK * duration)):
-        data = stream.read(CHUNK, exception_on_overflow=False)
-        frames.append(data)
+    # Capture runs on PortAudio's thread
+    time.sleep(duration)
 
     stream.stop_stream()
     stream.close()
     p.terminate()
 
-    wf = wave.open(filename, 'wb')
-    wf.setnchannels(CHANNELS)
-    wf.setsampwidth(p.get_sample_size(FORMAT))
-    wf.setframerate(sample_rate)
-    wf.writeframes(b''.join(frames))
     wf.close()
     return True
 
 def transcribe_openai(audio_path):
-    """Transcribe using OpenAI Whisper API with curl"""
+    """Transcribe using OpenAI Whisper API"""
+    try:
+        from openai import OpenAI
+    except ImportError:
+        print("❌ openai not installed. Run: pip3 install openai")
+        return None
+
     api_key = os.environ.get('OPENAI_API_KEY')
     if not api_key:
         print("❌ OPENAI_API_KEY not set")
         return None
 
-    result = subprocess.run([
-        'curl', '-s',
-        'https://api.openai.com/v1/audio/transcriptions',
-        '-H', f'Authorization: Bearer {api_key}',
-        '-F', f'file=@{audio_path}',
-        '-F', 'model=whisper-1'
-    ], capture_output=True, text=True)
-
     try:
-        response = json.loads(result.stdout)
-        return response.get('text', '')
-    except:
-        print(f"❌ API Error: {result.stdout}")
+        client = OpenAI(api_key=api_key)
+
+        with open(audio_path, 'rb') as audio_file:
+            transcript = client.audio.transcriptions.create(
+                model="whisper-1",
+                file=audio_file
+            )
+
+        return transcript.text
+    except Exception as e:
+        print(f"❌ API Error: {e}")
         return None
 
 def copy_to_clipboard(text):
@@ -92,18 +104,19 @@ def copy_to_clipboard(text):
     subprocess.run(['pbcopy'], input=text.encode(), check=True)
 
 def type_to_terminal(text):
-    """Auto-type text into the active terminal using AppleScript"""
-    # Escape special characters for AppleScript
-    escaped = text.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+    """Paste text into the active terminal via the clipboard using AppleScript"""
+    # A single Cmd+V costs the same for any length, unlike per-character keystrokes
+    copy_to_clipboard(text)
 
-    script = f'''
+    script = '''
     tell application "System Events"
-        keystroke "{escaped}"
+        keystroke "v" using command down
+        delay 0.02
         key code 36
     end tell
     '''
 
-    subprocess.run(['osascript', '-e', script], check=True)
+    subprocess.run(['osascript', '-'], input=script.encode(), check=True)
 
 def main():
     duration = int(sys.argv[1]) if len(sys.argv) > 1 else 5
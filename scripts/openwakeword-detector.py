@@ -10,6 +10,7 @@ Usage:
         python openwakeword-detector.py --model hey_jarvis --threshold 0.5
 """
 
+import os
 import sys
 import json
 import argparse
@@ -19,6 +20,134 @@ from pathlib import Path
 # Chunk size in samples (80ms at 16kHz = 1280 samples)
 CHUNK_SIZE = 1280
 
+# int16 -> float32 normalization factor
+PCM16_SCALE = np.float32(1.0 / 32768.0)
+
+# 80ms chunks after a detection during which further detections are suppressed.
+# The model scores 16 embeddings that each span 76 mel frames (~0.76s) and step
+# by one chunk, so its input covers ~1.96s (~25 chunks) of audio. After 26
+# chunks none of the pre-trigger audio is left, without a model reset. This is
+# counted in audio fed to the detector, so it also holds when the daemon stops
+# feeding stdin while it records the command.
+REFRACTORY_CHUNKS = 26
+
+# Consecutive silent 80ms chunks after which inference is skipped (640ms)
+SILENCE_GATE_CHUNKS = 8
+
+# Buffered debug output is flushed at least every 50 chunks (4s)
+DEBUG_FLUSH_CHUNKS = 50
+
+
+# Pre-encoded envelopes for the per-frame events, filled with %-formatting
+# instead of building and serializing a dict for every line
+_DEBUG_EVENT = b'{"debug": "%s: %.3f"}\n'
+_DETECTED_EVENT = b'{"detected": true, "model": %s, "score": %.4f}\n'
+
+
+# Numba is optional: when installed, int16 -> float32 normalization runs as a
+# cached native loop, otherwise as a single NumPy ufunc call.
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(cache=True, fastmath=True, boundscheck=False)
+    def _pcm16_to_float32(src, out):
+        inv = np.float32(1.0 / 32768.0)
+        for i in range(src.shape[0]):
+            out[i] = src[i] * inv
+else:
+    def _pcm16_to_float32(src, out):
+        np.multiply(src, PCM16_SCALE, out=out)
+
+
+def _builtin_model_path(openwakeword, name):
+    """
+    Return the bundled ONNX file of a built-in openWakeWord model, matched by
+    name the same way openWakeWord does, or None if it is not on disk.
+    """
+    try:
+        paths = openwakeword.get_pretrained_model_paths('onnx')
+    except Exception:
+        return None
+    for path in paths:
+        if name.replace(' ', '_') in os.path.basename(path) and os.path.exists(path):
+            return Path(path)
+    return None
+
+
+def _ensure_quantized(model_path, quantized_path, debug=False):
+    """
+    Return the path of an INT8 (dynamic quantization) copy of an ONNX model.
+
+    The quantized model is cached at quantized_path, whose file name sets the
+    model name openWakeWord reports. It is written to a temporary file first
+    so an interrupted run never leaves a partial model in the cache.
+    Falls back to the original FP32 model if quantization is unavailable
+    (onnxruntime.quantization needs the onnx package).
+    """
+    if quantized_path.exists() and quantized_path.stat().st_mtime >= model_path.stat().st_mtime:
+        return quantized_path
+
+    temp_path = quantized_path.with_name(f"{quantized_path.stem}.tmp{quantized_path.suffix}")
+    try:
+        from onnxruntime.quantization import quantize_dynamic, QuantType
+
+        quantized_path.parent.mkdir(parents=True, exist_ok=True)
+        quantize_dynamic(
+            str(model_path),
+            str(temp_path),
+            weight_type=QuantType.QInt8,
+            op_types_to_quantize=['MatMul', 'Gemm'],
+            per_channel=True,
+            reduce_range=True,
+        )
+        os.replace(temp_path, quantized_path)
+        return quantized_path
+    except Exception as e:
+        try:
+            temp_path.unlink()
+        except OSError:
+            pass
+        if debug:
+            print(json.dumps({"debug": f"INT8 quantization unavailable, using FP32 model: {str(e)}"}), flush=True)
+        return model_path
+
+
+def _tune_onnx_sessions():
+    """
+    Configure every onnxruntime session openWakeWord creates for single-stream,
+    low-latency inference on tiny 80ms inputs.
+
+    openWakeWord builds its sessions internally without exposing SessionOptions,
+    so InferenceSession is wrapped before the Model is constructed. The oneDNN
+    execution provider is preferred when the installed onnxruntime ships it.
+
+    Returns True if the oneDNN execution provider will be used.
+    """
+    import onnxruntime as ort
+
+    base_session = ort.InferenceSession
+
+    providers = None
+    if 'DnnlExecutionProvider' in ort.get_available_providers():
+        providers = [('DnnlExecutionProvider', {'use_arena': 0}), 'CPUExecutionProvider']
+
+    def tuned_session(path_or_bytes, sess_options=None, *args, **kwargs):
+        options = sess_options or ort.SessionOptions()
+        options.intra_op_num_threads = 1
+        options.inter_op_num_threads = 1
+        options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.enable_cpu_mem_arena = False
+        if providers and not args:
+            kwargs['providers'] = providers
+        return base_session(path_or_bytes, options, *args, **kwargs)
+
+    ort.InferenceSession = tuned_session
+    return providers is not None
+
 
 def main():
     parser = argparse.ArgumentParser(description='openWakeWord detector')
@@ -28,11 +157,19 @@ def main():
                         help='Detection threshold 0.0-1.0 (default: 0.65)')
     parser.add_argument('--vad-threshold', type=float, default=0.3,
                         help='VAD threshold 0.0-1.0 to filter non-speech audio (default: 0.3, 0=disabled)')
+    parser.add_argument('--batch', type=int, default=1,
+                        help='80ms chunks per predict() call (default: 1). Only the melspectrogram step is shared; '
+                             'the embedding and wake word models still run once per chunk. Adds up to (N-1)*80ms '
+                             'latency, and the first 5*N chunks after startup score 0')
+    parser.add_argument('--silence-peak', type=int, default=200,
+                        help='Peak int16 amplitude below which audio counts as silence; long silences skip inference (default: 200, 0=disabled)')
     parser.add_argument('--debug', action='store_true',
-                        help='Enable debug output')
+                        help='Enable debug output. Per-chunk score lines are buffered and can appear up to 4s '
+                             'late, or only once audio input resumes')
     parser.add_argument('--models-dir', type=str, default=None,
                         help='Custom models directory')
     args = parser.parse_args()
+    batch = max(1, args.batch)
 
     # Import openwakeword (deferred to allow pip install check)
     try:
@@ -62,6 +199,10 @@ def main():
     except ImportError:
         inference_fw = 'tflite'
 
+    enable_dnnl = False
+    if inference_fw == 'onnx':
+        enable_dnnl = _tune_onnx_sessions()
+
     # Check if Speex noise suppression is available (Linux only)
     enable_speex = False
     if sys.platform == 'linux':
@@ -76,7 +217,10 @@ def main():
     model_kwargs = {
         'inference_framework': inference_fw,
     }
-    if args.vad_threshold > 0:
+    # openWakeWord keeps one VAD score per predict() call and checks the slice
+    # [-7:-4] of them, so with batching the look-back would stretch N times.
+    # In that case VAD runs here once per 80ms chunk instead.
+    if args.vad_threshold > 0 and batch == 1:
         model_kwargs['vad_threshold'] = args.vad_threshold
     if enable_speex:
         model_kwargs['enable_speex_noise_suppression'] = True
@@ -85,14 +229,48 @@ def main():
     try:
         if custom_model_path.exists():
             # Use custom downloaded model
-            if args.debug:
-                print(json.dumps({"debug": f"Loading custom model: {custom_model_path} ({inference_fw}, vad={args.vad_threshold})"}), flush=True)
-            oww_model = Model(wakeword_models=[str(custom_model_path)], **model_kwargs)
+            wakeword_model = str(custom_model_path)
+            fp32_path = custom_model_path
+            source = 'custom'
         else:
             # Use built-in model (downloads automatically if needed)
-            if args.debug:
-                print(json.dumps({"debug": f"Loading built-in model: {args.model} ({inference_fw}, vad={args.vad_threshold})"}), flush=True)
-            oww_model = Model(wakeword_models=[args.model], **model_kwargs)
+            wakeword_model = args.model
+            fp32_path = _builtin_model_path(openwakeword, args.model) if inference_fw == 'onnx' else None
+            source = 'built-in'
+
+        # With onnx, prefer an INT8 copy cached as int8/<model>.onnx, so the
+        # reported model name stays the same for custom and built-in models
+        model_path = None
+        if fp32_path is not None:
+            model_path = _ensure_quantized(fp32_path, models_dir / 'int8' / f"{args.model}.onnx", args.debug)
+            if model_path == fp32_path:
+                model_path = None
+
+        if args.debug:
+            print(json.dumps({"debug": f"Loading {source} model: {model_path or wakeword_model} ({inference_fw}, vad={args.vad_threshold})"}), flush=True)
+        oww_model = None
+        if model_path is not None:
+            try:
+                oww_model = Model(wakeword_models=[str(model_path)], **model_kwargs)
+            except Exception as e:
+                # Discard a cached INT8 model that fails to load and use FP32
+                if args.debug:
+                    print(json.dumps({"debug": f"INT8 model failed to load, using FP32 model: {str(e)}"}), flush=True)
+                try:
+                    model_path.unlink()
+                except OSError:
+                    pass
+                model_path = None
+        if oww_model is None:
+            oww_model = Model(wakeword_models=[wakeword_model], **model_kwargs)
+
+        vad = None
+        if args.vad_threshold > 0 and batch > 1:
+            from openwakeword.vad import VAD
+            vad = VAD()
+
+        # Compile the normalization kernel (or load it from cache) before the first frame
+        _pcm16_to_float32(np.zeros(CHUNK_SIZE, dtype=np.int16), np.empty(CHUNK_SIZE, dtype=np.float32))
 
         # Signal ready
         features = []
@@ -100,49 +278,107 @@ def main():
             features.append(f"vad={args.vad_threshold}")
         if enable_speex:
             features.append("speex_ns")
+        if enable_dnnl:
+            features.append("dnnl")
+        if njit is not None:
+            features.append("numba")
+        if model_path is not None:
+            features.append("int8")
+        if batch > 1:
+            features.append(f"batch={batch}")
+        if args.silence_peak > 0:
+            features.append(f"silence_peak={args.silence_peak}")
         print(json.dumps({"status": "ready", "model": args.model, "threshold": args.threshold, "features": features}), flush=True)
     except Exception as e:
         print(json.dumps({"error": f"Failed to load model: {str(e)}"}), flush=True)
         sys.exit(1)
 
-    # Read raw PCM audio from stdin and process
-    buffer = b''
-    bytes_per_chunk = CHUNK_SIZE * 2  # 2 bytes per sample (16-bit)
+    # Several 80ms chunks can be submitted per predict() call; openWakeWord
+    # scores each one and returns the highest score per model. This only saves
+    # melspectrogram calls, the other models still run per chunk.
+    frame_samples = CHUNK_SIZE * batch
+    bytes_per_frame = frame_samples * 2  # 2 bytes per sample (16-bit)
 
-    while True:
-        try:
-            # Read audio data from stdin
-            data = sys.stdin.buffer.read(bytes_per_chunk)
-            if not data:
-                break
+    # Frames are read straight into frame_buf. stdin is a BufferedReader,
+    # so readinto() blocks until the frame is full and only comes up short
+    # at end of stream; a trailing partial frame is dropped.
+    frame_buf = bytearray(bytes_per_frame)
+    frame_view = memoryview(frame_buf)
+    frame_samples_i16 = np.frombuffer(frame_buf, dtype=np.int16)
+
+    # Normalized audio is written into this buffer in place, once per frame
+    audio = np.empty(frame_samples, dtype=np.float32)
+
+    chunks_processed = 0
+    last_trigger_chunk = -REFRACTORY_CHUNKS
+    last_flush_chunk = 0
+    silent_chunks = 0
+    write = sys.stdout.buffer.write
+    encoded_names = {}
+
+    def detect(samples):
+        """Run wake word prediction on one frame of int16 samples"""
+        nonlocal chunks_processed, last_trigger_chunk, last_flush_chunk, silent_chunks
+        chunks_processed += batch
+
+        if args.debug and chunks_processed - last_flush_chunk >= DEBUG_FLUSH_CHUNKS:
+            sys.stdout.buffer.flush()
+            last_flush_chunk = chunks_processed
+
+        # Energy gate: after a stretch of silence, skip inference until the
+        # peak amplitude rises above the floor again. The model is not reset:
+        # its state already ends in silence, and a reset would zero its next
+        # 5 predictions, blinding it to a wake word spoken right after a pause.
+        peak = max(int(samples.max()), -int(samples.min()))
+        if peak < args.silence_peak:
+            silent_chunks += batch
+            if silent_chunks >= SILENCE_GATE_CHUNKS:
+                return
+        else:
+            silent_chunks = 0
 
-            buffer += data
+        # Convert int16 -> float32 normalized
+        _pcm16_to_float32(samples, audio)
 
-            # Process complete chunks
-            while len(buffer) >= bytes_per_chunk:
-                chunk = buffer[:bytes_per_chunk]
-                buffer = buffer[bytes_per_chunk:]
+        # Run prediction
+        prediction = oww_model.predict(audio)
 
-                # Convert bytes to numpy array (int16 -> float32 normalized)
-                audio = np.frombuffer(chunk, dtype=np.int16).astype(np.float32) / 32768.0
+        if vad is not None:
+            # openWakeWord checks the slice [-7:-4] of per-chunk scores; the
+            # start is widened by batch - 1 to cover every chunk in the frame
+            for start in range(0, frame_samples, CHUNK_SIZE):
+                vad(audio[start:start + CHUNK_SIZE])
+            vad_frames = list(vad.prediction_buffer)[-(6 + batch):-4]
+            if not vad_frames or max(vad_frames) < args.vad_threshold:
+                prediction = dict.fromkeys(prediction, 0.0)
+        refractory = chunks_processed - last_trigger_chunk < REFRACTORY_CHUNKS
 
-                # Run prediction
-                prediction = oww_model.predict(audio)
+        # Check for detections
+        for model_name, score in prediction.items():
+            name = encoded_names.get(model_name)
+            if name is None:
+                # JSON-escaped once per model, including the quotes
+                name = encoded_names[model_name] = json.dumps(model_name).encode()
 
-                # Check for detections
-                for model_name, score in prediction.items():
-                    if args.debug and score > 0.1:
-                        print(json.dumps({"debug": f"{model_name}: {score:.3f}"}), flush=True)
+            if args.debug and score > 0.1:
+                write(_DEBUG_EVENT % (name[1:-1], score))
 
-                    if score >= args.threshold:
-                        print(json.dumps({
-                            "detected": True,
-                            "model": model_name,
-                            "score": float(score)
-                        }), flush=True)
+            if score >= args.threshold and not refractory:
+                write(_DETECTED_EVENT % (name, score))
+                sys.stdout.buffer.flush()
+                last_flush_chunk = chunks_processed
+
+                # Suppress repeated triggers while the model state keeps warm
+                last_trigger_chunk = chunks_processed
+                refractory = True
+
+    while True:
+        try:
+            # Read audio data from stdin
+            if sys.stdin.buffer.readinto(frame_view) < bytes_per_frame:
+                break
 
-                        # Reset model state after detection to prevent repeated triggers
-                        oww_model.reset()
+            detect(frame_samples_i16)
 
         except KeyboardInterrupt:
             break
@@ -64,6 +64,8 @@ export interface WakeWordConfig {
     model?: string;
     threshold?: number;
     vadThreshold?: number;
+    batch?: number;
+    silencePeak?: number;
     debug?: boolean;
   };
 }
@@ -139,6 +139,8 @@ export class OpenWakeWordDetector extends EventEmitter {
     const model = this.config.openwakeword?.model || 'hey_jarvis';
     const threshold = this.config.openwakeword?.threshold || 0.65;
     const vadThreshold = this.config.openwakeword?.vadThreshold ?? 0.3;
+    const batch = this.config.openwakeword?.batch ?? 1;
+    const silencePeak = this.config.openwakeword?.silencePeak ?? 200;
     const debug = this.config.openwakeword?.debug || false;
     const modelsDir = path.join(os.homedir(), '.claude-voice', 'models', 'openwakeword');
 
@@ -150,6 +152,10 @@ export class OpenWakeWordDetector extends EventEmitter {
       String(threshold),
       '--vad-threshold',
       String(vadThreshold),
+      '--batch',
+      String(batch),
+      '--silence-peak',
+      String(silencePeak),
       '--models-dir',
       modelsDir,
     ];
@@ -215,6 +221,7 @@ export class OpenWakeWordDetector extends EventEmitter {
     score?: number;
     error?: string;
     debug?: string;
+    features?: string[];
   }): void {
     if (event.error) {
       console.error(`openWakeWord error: ${event.error}`);
@@ -227,7 +234,8 @@ export class OpenWakeWordDetector extends EventEmitter {
     }
 
     if (event.status === 'ready') {
-      console.log(`openWakeWord ready (model: ${event.model})`);
+      const features = event.features?.length ? `, ${event.features.join(', ')}` : '';
+      console.log(`openWakeWord ready (model: ${event.model}${features})`);
       return;
     }
 
@@ -449,9 +457,9 @@ export async function installOpenWakeWord(): Promise<void> {
   console.log('Installing openWakeWord...');
   // Try multiple pip strategies for compatibility with Homebrew/system Python (PEP 668)
   const strategies = [
-    `${pythonCmd} -m pip install openwakeword onnxruntime`,
-    `${pythonCmd} -m pip install --user openwakeword onnxruntime`,
-    `${pythonCmd} -m pip install --break-system-packages openwakeword onnxruntime`,
+    `${pythonCmd} -m pip install openwakeword onnxruntime onnx`,
+    `${pythonCmd} -m pip install --user openwakeword onnxruntime onnx`,
+    `${pythonCmd} -m pip install --break-system-packages openwakeword onnxruntime onnx`,
   ];
   let installed = false;
   for (const cmd of strategies) {